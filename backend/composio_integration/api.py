@@ -1,5 +1,5 @@
 from fastapi import APIRouter, HTTPException, Depends, Query, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from typing import Dict, Any, Optional
 from pydantic import BaseModel
 from uuid import uuid4
@@ -20,7 +20,7 @@ import base64
 from .composio_service import (
     get_integration_service,
 )
-from .toolkit_service import ToolkitService, ToolsListResponse
+from .toolkit_service import ToolkitService, ToolsListResponse, encode_toolkit_list
 from .composio_profile_service import ComposioProfileService, ComposioProfile
 from .composio_trigger_service import ComposioTriggerService
 from triggers.trigger_service import get_trigger_service, TriggerEvent, TriggerType
@@ -224,7 +224,7 @@ async def list_categories(
         
         return {
             "success": True,
-            "categories": [cat.dict() for cat in categories],
+            "categories": [cat.model_dump() for cat in categories],
             "total": len(categories)
         }
         
@@ -235,12 +235,12 @@ async def list_categories(
 
 @router.get("/toolkits")
 async def list_toolkits(
-    limit: int = Query(100, le=500),
+    limit: int = Query(100, ge=1, le=500),
     cursor: Optional[str] = Query(None),
     search: Optional[str] = Query(None),
     category: Optional[str] = Query(None),
     user_id: str = Depends(get_current_user_id_from_jwt)
-) -> Dict[str, Any]:
+) -> Response:
     try:
         logger.info(f"Fetching Composio toolkits with limit: {limit}, cursor: {cursor}, search: {search}, category: {category}")
         
@@ -248,18 +248,11 @@ async def list_toolkits(
         
         if search:
             result = await service.search_toolkits(search, category=category, limit=limit, cursor=cursor)
+            content = encode_toolkit_list(result)
         else:
-            result = await service.list_available_toolkits(limit, cursor=cursor, category=category)
+            content = await service.list_available_toolkits_json(limit, cursor=cursor, category=category)
         
-        return {
-            "success": True,
-            "toolkits": [toolkit.dict() for toolkit in result.get('items', [])],
-            "total_items": result.get('total_items', 0),
-            "total_pages": result.get('total_pages', 0),
-            "current_page": result.get('current_page', 1),
-            "next_cursor": result.get('next_cursor'),
-            "has_more": result.get('next_cursor') is not None
-        }
+        return Response(content=content, media_type="application/json")
         
     except Exception as e:
         logger.error(f"Failed to fetch toolkits: {e}", exc_info=True)
@@ -282,7 +275,7 @@ async def get_toolkit_details(
         
         return {
             "success": True,
-            "toolkit": detailed_toolkit.dict()
+            "toolkit": detailed_toolkit.model_dump()
         }
         
     except HTTPException:
@@ -557,7 +550,7 @@ async def list_toolkit_tools(
         
         return {
             "success": True,
-            "tools": [tool.dict() for tool in tools_response.items],
+            "tools": [tool.model_dump() for tool in tools_response.items],
             "total_items": tools_response.total_items,
             "current_page": tools_response.current_page,
             "total_pages": tools_response.total_pages,
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from typing import Optional
 from composio_client import Composio
 from utils.logger import logger
@@ -23,7 +24,9 @@ class ComposioClient:
     @classmethod
     def reset_client(cls) -> None:
         cls._instance = None
+        get_composio_client.cache_clear()
 
 
+@lru_cache(maxsize=8)
 def get_composio_client(api_key: Optional[str] = None) -> Composio:
     return ComposioClient.get_client(api_key) 
\ No newline at end of file
@@ -123,6 +123,9 @@ class ComposioIntegrationService:
     async def list_available_toolkits(self, limit: int = 100, cursor: Optional[str] = None, category: Optional[str] = None) -> Dict[str, Any]:
         return await self.toolkit_service.list_toolkits(limit=limit, cursor=cursor, category=category)
     
+    async def list_available_toolkits_json(self, limit: int = 100, cursor: Optional[str] = None, category: Optional[str] = None) -> bytes:
+        return await self.toolkit_service.list_toolkits_json(limit=limit, cursor=cursor, category=category)
+    
     async def search_toolkits(self, query: str, category: Optional[str] = None, limit: int = 100, cursor: Optional[str] = None) -> Dict[str, Any]:
         return await self.toolkit_service.search_toolkits(query, category=category, limit=limit, cursor=cursor)
     
@@ -1,15 +1,104 @@
-from typing import List, Dict, Any, Optional
-from pydantic import BaseModel
+import asyncio
+import time
+import orjson
+from collections import OrderedDict
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Tuple
+from pydantic import BaseModel, ConfigDict
+from typing_extensions import TypedDict
 from utils.logger import logger
-from .client import ComposioClient
+from utils.cache import Cache
+from .client import get_composio_client
+
+
+# Toolkit payloads come straight from the Composio SDK and are normalised
+# below before we build our response models, so the hot list/detail paths
+# skip pydantic validation via model_construct. Flip to False to exercise
+# the validating constructors (e.g. in tests). Anything user-supplied must
+# still go through model_validate.
+_TRUSTED = True
+
+
+def _build(model, **data):
+    if _TRUSTED:
+        return model.model_construct(**data)
+    return model(**data)
+
+
+_MISSING = object()
+
+
+def _cache_get(cache: OrderedDict, key: Any) -> Any:
+    entry = cache.get(key)
+    if entry is None:
+        return _MISSING
+    if entry[0] <= time.monotonic():
+        del cache[key]
+        return _MISSING
+    cache.move_to_end(key)
+    return entry[1]
+
+
+def _cache_put(cache: OrderedDict, key: Any, value: Any, ttl: float, maxsize: int) -> None:
+    # Purge expired entries on every store and evict least recently used
+    # ones past maxsize, so request-controlled keys can't grow the cache.
+    now = time.monotonic()
+    for stale_key in [k for k, (expires_at, _) in cache.items() if expires_at <= now]:
+        del cache[stale_key]
+    cache[key] = (now + ttl, value)
+    cache.move_to_end(key)
+    while len(cache) > maxsize:
+        cache.popitem(last=False)
+
+
+def encode_toolkit_list(result: Dict[str, Any]) -> bytes:
+    return orjson.dumps({
+        "success": True,
+        "toolkits": result.get('items', []),
+        "total_items": result.get('total_items', 0),
+        "total_pages": result.get('total_pages', 0),
+        "current_page": result.get('current_page', 1),
+        "next_cursor": result.get('next_cursor'),
+        "has_more": result.get('next_cursor') is not None
+    }, default=lambda o: o.__dict__)
+
+
+def _to_dict(obj: Any) -> Dict[str, Any]:
+    # The SDK hands back a mix of dicts, model objects and namedtuples.
+    if obj is None:
+        return {}
+    if isinstance(obj, dict):
+        return obj
+    if hasattr(obj, '__dict__'):
+        return obj.__dict__
+    if hasattr(obj, '_asdict'):
+        return obj._asdict()
+    return dict(obj)
 
 
 class CategoryInfo(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
 
 
+_CATEGORIES: Tuple[CategoryInfo, ...] = (
+    CategoryInfo(id="popular", name="Popular"),
+    CategoryInfo(id="productivity", name="Productivity"),
+    CategoryInfo(id="crm", name="CRM"),
+    CategoryInfo(id="marketing", name="Marketing"),
+    CategoryInfo(id="analytics", name="Analytics"),
+    CategoryInfo(id="communication", name="Communication"),
+    CategoryInfo(id="project-management", name="Project Management"),
+    CategoryInfo(id="scheduling", name="Scheduling"),
+)
+
+
 class ToolkitInfo(BaseModel):
+    # Instances are shared through the list cache, so keep them read-only.
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     slug: str
     name: str
     description: Optional[str] = None
@@ -19,20 +108,63 @@ class ToolkitInfo(BaseModel):
     categories: List[str] = []
 
 
-class AuthConfigField(BaseModel):
+# Plain dicts so DetailedToolkitInfo doesn't carry nested models.
+# pydantic needs the typing_extensions TypedDict on Python < 3.12.
+class AuthConfigField(TypedDict, total=False):
     name: str
     displayName: str
     type: str
-    description: Optional[str] = None
-    required: bool = False
-    default: Optional[str] = None
-    legacy_template_name: Optional[str] = None
+    description: Optional[str]
+    required: bool
+    default: Optional[str]
+    legacy_template_name: Optional[str]
 
 
-class AuthConfigDetails(BaseModel):
+class AuthConfigDetails(TypedDict, total=False):
     name: str
     mode: str
-    fields: Dict[str, Dict[str, List[AuthConfigField]]]
+    # (field_type, requirement_level, field) triples
+    fields: List[Tuple[str, str, AuthConfigField]]
+
+
+_OAUTH2_REQUIRED = frozenset({"OAUTH2"})
+
+
+def _has_required_schemes(auth_schemes: List[str], composio_managed_auth_schemes: List[str]) -> bool:
+    # Plain membership tests on the short scheme lists; set operations here
+    # would build a temporary set per toolkit.
+    for scheme in _OAUTH2_REQUIRED:
+        if scheme not in auth_schemes or scheme not in composio_managed_auth_schemes:
+            return False
+    return True
+
+_FIELD_KEYS = ('name', 'display_name', 'type', 'description', 'required', 'default', 'legacy_template_name')
+_get_field_values = itemgetter(*_FIELD_KEYS)
+
+
+def _build_field(field: Any) -> AuthConfigField:
+    field_dict = _to_dict(field)
+    try:
+        # SDK objects always carry every key, so this is the common path.
+        name, display_name, field_type, description, required, default, legacy_template_name = _get_field_values(field_dict)
+    except KeyError:
+        name, display_name, field_type, description, required, default, legacy_template_name = map(field_dict.get, _FIELD_KEYS)
+    return {
+        'name': name or '',
+        'displayName': display_name or '',
+        'type': field_type or 'string',
+        'description': description,
+        'required': required or False,
+        'default': default,
+        'legacy_template_name': legacy_template_name
+    }
+
+
+def _initiation_fields(fields: List[Tuple[str, str, AuthConfigField]], requirement_level: str) -> List[AuthConfigField]:
+    return [
+        field for field_type, level, field in fields
+        if field_type == 'connected_account_initiation' and level == requirement_level
+    ]
 
 
 class DetailedToolkitInfo(BaseModel):
@@ -74,40 +206,83 @@ class ToolsListResponse(BaseModel):
 
 
 class ToolkitService:
+    # Shared across instances since callers build a ToolkitService per
+    # request. Bounded LRUs of (expires_at, value) on the monotonic clock.
+    _cache_ttl = 300
+    _list_cache_size = 32
+    # List entries hold (result, encoded /toolkits response body) so route
+    # hits can serve pre-encoded bytes.
+    _list_cache: "OrderedDict[Tuple[int, Optional[str], Optional[str]], Tuple[float, Tuple[Dict[str, Any], bytes]]]" = OrderedDict()
+    _detail_cache_size = 256
+    _detail_cache: "OrderedDict[str, Tuple[float, DetailedToolkitInfo]]" = OrderedDict()
+    # Icons almost never change, so they get a much longer TTL and are also
+    # kept in Redis to survive restarts.
+    _icon_ttl = 24 * 60 * 60
+    _icon_cache_size = 1024
+    _icon_cache: "OrderedDict[str, Tuple[float, Optional[str]]]" = OrderedDict()
+    _bulk_concurrency = 16
+    # Fetches in flight, keyed like the caches, so concurrent misses for the
+    # same key (cold start, TTL expiry, repeated slugs in bulk calls) share
+    # one upstream call instead of each issuing their own.
+    _pending: Dict[Tuple[str, Any], "asyncio.Task[Any]"] = {}
+    # Bumped by invalidate_cache; fetches started under an older generation
+    # still return their result but don't write it into the caches.
+    _cache_generation = 0
+
     def __init__(self, api_key: Optional[str] = None):
-        self.client = ComposioClient.get_client(api_key)
+        self.client = get_composio_client(api_key)
     
     async def list_categories(self) -> List[CategoryInfo]:
-        try:
-            logger.info("Fetching Composio categories")
-            popular_categories = [
-                {"id": "popular", "name": "Popular"},
-                {"id": "productivity", "name": "Productivity"},
-                {"id": "crm", "name": "CRM"},
-                {"id": "marketing", "name": "Marketing"},
-                {"id": "analytics", "name": "Analytics"},
-                {"id": "communication", "name": "Communication"},
-                {"id": "project-management", "name": "Project Management"},
-                {"id": "scheduling", "name": "Scheduling"},
-            ]
+        return list(_CATEGORIES)
 
-            special_apps=[
-                "googlesuper",
-                'googleclassroom',
-                "docusign"
-            ]
-            
-            categories = [CategoryInfo(**cat) for cat in popular_categories]
-            logger.info(f"Successfully fetched {len(categories)} categories")
-            return categories
-            
-        except Exception as e:
-            logger.error(f"Failed to list categories: {e}", exc_info=True)
-            raise
+    @classmethod
+    async def _shared_fetch(cls, key: Tuple[str, Any], fetch):
+        task = cls._pending.get(key)
+        if task is None or task.done():
+            task = asyncio.ensure_future(fetch())
+            cls._pending[key] = task
+
+            def clear(done: "asyncio.Task[Any]") -> None:
+                if cls._pending.get(key) is done:
+                    del cls._pending[key]
+
+            task.add_done_callback(clear)
+        # shield so one cancelled caller doesn't cancel the fetch for the rest
+        return await asyncio.shield(task)
+
+    @classmethod
+    def _store(cls, generation: int, cache: OrderedDict, key: Any, value: Any, ttl: float, maxsize: int) -> None:
+        if generation == cls._cache_generation:
+            _cache_put(cache, key, value, ttl, maxsize)
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        cls._cache_generation += 1
+        cls._pending.clear()
+        cls._list_cache.clear()
+        cls._detail_cache.clear()
+        cls._icon_cache.clear()
     
     async def list_toolkits(self, limit: int = 500, cursor: Optional[str] = None, category: Optional[str] = None) -> Dict[str, Any]:
+        result, _ = await self._get_toolkit_list(limit, cursor, category)
+        return result
+
+    async def list_toolkits_json(self, limit: int = 500, cursor: Optional[str] = None, category: Optional[str] = None) -> bytes:
+        _, encoded = await self._get_toolkit_list(limit, cursor, category)
+        return encoded
+
+    async def _get_toolkit_list(self, limit: int, cursor: Optional[str], category: Optional[str]) -> Tuple[Dict[str, Any], bytes]:
+        cache_key = (limit, cursor, category)
+        cached = _cache_get(self._list_cache, cache_key)
+        if cached is not _MISSING:
+            return cached
+        return await self._shared_fetch(("list", cache_key), lambda: self._fetch_toolkits(limit, cursor, category))
+
+    async def _fetch_toolkits(self, limit: int, cursor: Optional[str], category: Optional[str]) -> Tuple[Dict[str, Any], bytes]:
+        generation = self._cache_generation
+        cache_key = (limit, cursor, category)
         try:
-            logger.info(f"Fetching toolkits with limit: {limit}, cursor: {cursor}, category: {category}")
+            logger.debug("Fetching toolkits with limit: %s, cursor: %s, category: %s", limit, cursor, category)
             params = {
                 "limit": limit,
                 "managed_by": "composio"
@@ -118,66 +293,34 @@ class ToolkitService:
             if category:
                 params["category"] = category
             
-            toolkits_response = self.client.toolkits.list(**params)
-            
-            if hasattr(toolkits_response, '__dict__'):
-                response_data = toolkits_response.__dict__
-            else:
-                response_data = toolkits_response
+            response_data = await self._raw_list_toolkits(params)
             
             items = response_data.get('items', [])
             
             toolkits = []
+            search_blobs = []
             for item in items:
-                if hasattr(item, '__dict__'):
-                    toolkit_data = item.__dict__
-                elif hasattr(item, '_asdict'):
-                    toolkit_data = item._asdict()
-                else:
-                    toolkit_data = item
+                toolkit_data = _to_dict(item)
                 
-                auth_schemes = toolkit_data.get("auth_schemes", [])
-                composio_managed_auth_schemes = toolkit_data.get("composio_managed_auth_schemes", [])
+                auth_schemes = toolkit_data.get("auth_schemes") or []
+                composio_managed_auth_schemes = toolkit_data.get("composio_managed_auth_schemes") or []
 
-                if "OAUTH2" not in auth_schemes or "OAUTH2" not in composio_managed_auth_schemes:
+                if not _has_required_schemes(auth_schemes, composio_managed_auth_schemes):
                     continue
                 
-                logo_url = None
-                meta = toolkit_data.get("meta", {})
-                if isinstance(meta, dict):
-                    logo_url = meta.get("logo")
-                elif hasattr(meta, '__dict__'):
-                    logo_url = meta.__dict__.get("logo")
-                
-                if not logo_url:
-                    logo_url = toolkit_data.get("logo")
+                meta = _to_dict(toolkit_data.get("meta"))
+                logo_url = meta.get("logo") or toolkit_data.get("logo")
+                description = meta.get("description") or toolkit_data.get("description")
                 
                 tags = []
                 categories = []
-                if isinstance(meta, dict) and "categories" in meta:
-                    category_list = meta.get("categories", [])
-                    for cat in category_list:
-                        if isinstance(cat, dict):
-                            cat_name = cat.get("name", "")
-                            cat_id = cat.get("id", "")
-                            tags.append(cat_name)
-                            categories.append(cat_id)
-                        elif hasattr(cat, '__dict__'):
-                            cat_name = cat.__dict__.get("name", "")
-                            cat_id = cat.__dict__.get("id", "")
-                            tags.append(cat_name)
-                            categories.append(cat_id)
-                
-                description = None
-                if isinstance(meta, dict):
-                    description = meta.get("description")
-                elif hasattr(meta, '__dict__'):
-                    description = meta.__dict__.get("description")
+                for cat in meta.get("categories") or []:
+                    cat_dict = _to_dict(cat)
+                    tags.append(cat_dict.get("name", ""))
+                    categories.append(cat_dict.get("id", ""))
                 
-                if not description:
-                    description = toolkit_data.get("description")
-                
-                toolkit = ToolkitInfo(
+                toolkit = _build(
+                    ToolkitInfo,
                     slug=toolkit_data.get("slug", ""),
                     name=toolkit_data.get("name", ""),
                     description=description,
@@ -187,30 +330,40 @@ class ToolkitService:
                     categories=categories
                 )
                 toolkits.append(toolkit)
+                search_blobs.append("\x00".join([toolkit.name or "", toolkit.description or "", *(tag or "" for tag in tags)]).lower())
             
             result = {
                 "items": toolkits,
                 "total_items": response_data.get("total_items", len(toolkits)),
                 "total_pages": response_data.get("total_pages", 1),
                 "current_page": response_data.get("current_page", 1),
-                "next_cursor": response_data.get("next_cursor")
+                "next_cursor": response_data.get("next_cursor"),
+                # reversed so the first toolkit wins on duplicate slugs
+                "_by_slug": {toolkit.slug: toolkit for toolkit in reversed(toolkits)},
+                # lowercased name/description/tags, aligned with items
+                "_search_blobs": search_blobs
             }
             
-            logger.info(f"Successfully fetched {len(toolkits)} toolkits with OAUTH2 in both auth schemes" + (f" for category {category}" if category else ""))
-            return result
+            entry = (result, encode_toolkit_list(result))
+            self._store(generation, self._list_cache, cache_key, entry, self._cache_ttl, self._list_cache_size)
+            logger.debug("Successfully fetched %d toolkits with OAUTH2 in both auth schemes, category: %s", len(toolkits), category)
+            return entry
             
         except Exception as e:
             logger.error(f"Failed to list toolkits: {e}", exc_info=True)
             raise
     
+    async def _raw_list_toolkits(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        # Goes through the SDK transport (retries, timeout, base URL, auth) but
+        # decodes the body straight to dicts instead of hydrating the SDK's
+        # generated models for every item.
+        raw = await asyncio.to_thread(self.client.toolkits.with_raw_response.list, **params)
+        return orjson.loads(raw.http_response.content)
+    
     async def get_toolkit_by_slug(self, slug: str) -> Optional[ToolkitInfo]:
         try:
             toolkits_response = await self.list_toolkits()
-            toolkits = toolkits_response.get("items", [])
-            for toolkit in toolkits:
-                if toolkit.slug == slug:
-                    return toolkit
-            return None
+            return toolkits_response["_by_slug"].get(slug)
         except Exception as e:
             logger.error(f"Failed to get toolkit {slug}: {e}", exc_info=True)
             raise
@@ -219,13 +372,12 @@ class ToolkitService:
         try:
             all_toolkits_response = await self.list_toolkits(limit=500, cursor=cursor, category=category)
             toolkits = all_toolkits_response.get("items", [])
+            search_blobs = all_toolkits_response["_search_blobs"]
             query_lower = query.lower()
             
             filtered_toolkits = [
-                toolkit for toolkit in toolkits
-                if query_lower in toolkit.name.lower() 
-                or (toolkit.description and query_lower in toolkit.description.lower())
-                or any(query_lower in tag.lower() for tag in toolkit.tags)
+                toolkits[i] for i, blob in enumerate(search_blobs)
+                if query_lower in blob
             ]
             
             limited_results = filtered_toolkits[:limit]
@@ -238,7 +390,7 @@ class ToolkitService:
                 "next_cursor": None
             }
             
-            logger.info(f"Found {len(filtered_toolkits)} toolkits with OAUTH2 in both auth schemes matching query: {query}" + (f" in category {category}" if category else ""))
+            logger.debug("Found %d toolkits with OAUTH2 in both auth schemes matching query: %s, category: %s", len(filtered_toolkits), query, category)
             return result
             
         except Exception as e:
@@ -246,26 +398,35 @@ class ToolkitService:
             raise
     
     async def get_toolkit_icon(self, toolkit_slug: str) -> Optional[str]:
+        cached = _cache_get(self._icon_cache, toolkit_slug)
+        if cached is not _MISSING:
+            return cached
+        return await self._shared_fetch(("icon", toolkit_slug), lambda: self._fetch_toolkit_icon(toolkit_slug))
+
+    async def _fetch_toolkit_icon(self, toolkit_slug: str) -> Optional[str]:
+        generation = self._cache_generation
+        redis_key = f"composio:toolkit_icon:{toolkit_slug}"
         try:
-            logger.info(f"Fetching toolkit icon for: {toolkit_slug}")
-            toolkit_response = self.client.toolkits.retrieve(toolkit_slug)
-            
-            if hasattr(toolkit_response, 'model_dump'):
-                toolkit_dict = toolkit_response.model_dump()
-            elif hasattr(toolkit_response, '__dict__'):
-                toolkit_dict = toolkit_response.__dict__
-            else:
-                toolkit_dict = dict(toolkit_response)
-            
-            meta = toolkit_dict.get('meta', {})
-            if isinstance(meta, dict):
-                logo = meta.get('logo')
-            elif hasattr(meta, '__dict__'):
-                logo = meta.__dict__.get('logo')
-            else:
-                logo = None
-            
-            logger.info(f"Successfully fetched icon for {toolkit_slug}: {logo}")
+            logo = await Cache.get(redis_key)
+            if logo:
+                self._store(generation, self._icon_cache, toolkit_slug, logo, self._icon_ttl, self._icon_cache_size)
+                return logo
+        except Exception:
+            pass
+
+        try:
+            logger.debug("Fetching toolkit icon for: %s", toolkit_slug)
+            toolkit_response = await asyncio.to_thread(self.client.toolkits.retrieve, toolkit_slug)
+            toolkit_dict = _to_dict(toolkit_response)
+            logo = _to_dict(toolkit_dict.get('meta')).get('logo')
+            
+            self._store(generation, self._icon_cache, toolkit_slug, logo, self._icon_ttl, self._icon_cache_size)
+            if logo:
+                try:
+                    await Cache.set(redis_key, logo, ttl=self._icon_ttl)
+                except Exception:
+                    pass
+            logger.debug("Successfully fetched icon for %s: %s", toolkit_slug, logo)
             return logo
             
         except Exception as e:
@@ -273,151 +434,96 @@ class ToolkitService:
             return None
 
     async def get_detailed_toolkit_info(self, toolkit_slug: str) -> Optional[DetailedToolkitInfo]:
+        cached = _cache_get(self._detail_cache, toolkit_slug)
+        if cached is not _MISSING:
+            return cached
+        return await self._shared_fetch(("detail", toolkit_slug), lambda: self._fetch_detailed_toolkit_info(toolkit_slug))
+
+    async def _fetch_detailed_toolkit_info(self, toolkit_slug: str) -> Optional[DetailedToolkitInfo]:
+        generation = self._cache_generation
         try:
-            logger.info(f"Fetching detailed toolkit info for: {toolkit_slug}")
-            toolkit_response = self.client.toolkits.retrieve(toolkit_slug)
+            logger.debug("Fetching detailed toolkit info for: %s", toolkit_slug)
+            toolkit_response = await asyncio.to_thread(self.client.toolkits.retrieve, toolkit_slug)
+            toolkit_dict = _to_dict(toolkit_response)
             
-            if hasattr(toolkit_response, 'model_dump'):
-                toolkit_dict = toolkit_response.model_dump()
-            elif hasattr(toolkit_response, '__dict__'):
-                toolkit_dict = toolkit_response.__dict__
-            else:
-                toolkit_dict = dict(toolkit_response)
+            meta = _to_dict(toolkit_dict.get('meta'))
             
-            logger.info(f"Raw toolkit response for {toolkit_slug}: {toolkit_response}")
-            
-            meta = toolkit_dict.get('meta', {})
-            if hasattr(meta, '__dict__'):
-                meta = meta.__dict__
-            
-            detailed_toolkit = DetailedToolkitInfo(
+            detailed_toolkit = _build(
+                DetailedToolkitInfo,
                 slug=toolkit_dict.get('slug', ''),
                 name=toolkit_dict.get('name', ''),
-                description=meta.get('description', '') if isinstance(meta, dict) else getattr(meta, 'description', ''),
-                logo=meta.get('logo') if isinstance(meta, dict) else getattr(meta, 'logo', None),
+                description=meta.get('description', ''),
+                logo=meta.get('logo'),
                 tags=[],
                 auth_schemes=toolkit_dict.get('composio_managed_auth_schemes', []),
                 categories=[],
                 base_url=toolkit_dict.get('base_url')
             )
             
-            categories_data = meta.get('categories', []) if isinstance(meta, dict) else getattr(meta, 'categories', [])
             detailed_toolkit.categories = [
-                cat.get('name', '') if isinstance(cat, dict) else getattr(cat, 'name', '') 
-                for cat in categories_data
+                _to_dict(cat).get('name', '')
+                for cat in meta.get('categories') or []
             ]
             
-            logger.info(f"Parsed basic toolkit info: {detailed_toolkit}")
-            
             auth_config_details = []
+            connected_account_initiation = None
             raw_auth_configs = toolkit_dict.get('auth_config_details', [])
             
             for config in raw_auth_configs:
-                if hasattr(config, '__dict__'):
-                    config_dict = config.__dict__
-                else:
-                    config_dict = config
-                
-                fields_obj = config_dict.get('fields')
-                if hasattr(fields_obj, '__dict__'):
-                    fields_dict = fields_obj.__dict__
-                else:
-                    fields_dict = fields_obj or {}
+                config_dict = _to_dict(config)
+                fields_dict = _to_dict(config_dict.get('fields'))
                 
-                auth_fields = {}
+                auth_fields = []
                 
                 for field_type, field_type_obj in fields_dict.items():
-                    auth_fields[field_type] = {}
+                    field_type_dict = _to_dict(field_type_obj)
                     
-                    if hasattr(field_type_obj, '__dict__'):
-                        field_type_dict = field_type_obj.__dict__
-                    else:
-                        field_type_dict = field_type_obj or {}
-                    
-                    for requirement_level in ['required', 'optional']:
-                        field_list = field_type_dict.get(requirement_level, [])
-                        
-                        auth_config_fields = []
-                        for field in field_list:
-                            if hasattr(field, '__dict__'):
-                                field_dict = field.__dict__
-                            else:
-                                field_dict = field
-                            
-                            auth_config_fields.append(AuthConfigField(
-                                name=field_dict.get('name', ''),
-                                displayName=field_dict.get('display_name', ''),
-                                type=field_dict.get('type', 'string'),
-                                description=field_dict.get('description'),
-                                required=field_dict.get('required', False),
-                                default=field_dict.get('default'),
-                                legacy_template_name=field_dict.get('legacy_template_name')
-                            ))
-                        auth_fields[field_type][requirement_level] = auth_config_fields
+                    for requirement_level in ('required', 'optional'):
+                        for field in field_type_dict.get(requirement_level) or []:
+                            auth_fields.append((field_type, requirement_level, _build_field(field)))
+                
+                if connected_account_initiation is None and fields_dict.get('connected_account_initiation'):
+                    connected_account_initiation = {
+                        'required': _initiation_fields(auth_fields, 'required'),
+                        'optional': _initiation_fields(auth_fields, 'optional')
+                    }
                 
-                auth_config_details.append(AuthConfigDetails(
-                    name=config_dict.get('name', ''),
-                    mode=config_dict.get('mode', ''),
-                    fields=auth_fields
-                ))
+                auth_config_details.append({
+                    'name': config_dict.get('name', ''),
+                    'mode': config_dict.get('mode', ''),
+                    'fields': auth_fields
+                })
             
             detailed_toolkit.auth_config_details = auth_config_details
             
-            connected_account_initiation = None
-            for config in raw_auth_configs:
-                if hasattr(config, '__dict__'):
-                    config_dict = config.__dict__
-                else:
-                    config_dict = config
-                
-                fields_obj = config_dict.get('fields')
-                if hasattr(fields_obj, '__dict__'):
-                    fields_dict = fields_obj.__dict__
-                else:
-                    fields_dict = fields_obj or {}
-                
-                initiation_obj = fields_dict.get('connected_account_initiation')
-                if initiation_obj:
-                    if hasattr(initiation_obj, '__dict__'):
-                        initiation_dict = initiation_obj.__dict__
-                    else:
-                        initiation_dict = initiation_obj
-                    
-                    connected_account_initiation = {}
-                    for requirement_level in ['required', 'optional']:
-                        field_list = initiation_dict.get(requirement_level, [])
-                        initiation_fields = []
-                        for field in field_list:
-                            if hasattr(field, '__dict__'):
-                                field_dict = field.__dict__
-                            else:
-                                field_dict = field
-                            
-                            initiation_fields.append(AuthConfigField(
-                                name=field_dict.get('name', ''),
-                                displayName=field_dict.get('display_name', ''),
-                                type=field_dict.get('type', 'string'),
-                                description=field_dict.get('description'),
-                                required=field_dict.get('required', False),
-                                default=field_dict.get('default'),
-                                legacy_template_name=field_dict.get('legacy_template_name')
-                            ))
-                        connected_account_initiation[requirement_level] = initiation_fields
-                    break
-            
             detailed_toolkit.connected_account_initiation_fields = connected_account_initiation
+            self._store(generation, self._detail_cache, toolkit_slug, detailed_toolkit, self._cache_ttl, self._detail_cache_size)
             
-            logger.info(f"Successfully fetched detailed info for {toolkit_slug}")
-            logger.info(f"Initiation fields: {connected_account_initiation}")
+            logger.debug("Successfully fetched detailed info for %s with %d auth configs", toolkit_slug, len(auth_config_details))
             return detailed_toolkit
             
         except Exception as e:
             logger.error(f"Failed to get detailed toolkit info for {toolkit_slug}: {e}", exc_info=True)
             return None
 
+    async def _gather_bounded(self, fetch, slugs: List[str]) -> List[Any]:
+        semaphore = asyncio.Semaphore(self._bulk_concurrency)
+
+        async def fetch_one(slug: str):
+            async with semaphore:
+                return await fetch(slug)
+
+        return await asyncio.gather(*(fetch_one(slug) for slug in slugs))
+
+    async def get_toolkit_icon_bulk(self, toolkit_slugs: List[str]) -> List[Optional[str]]:
+        return await self._gather_bounded(self.get_toolkit_icon, toolkit_slugs)
+
+    async def get_detailed_toolkit_info_bulk(self, toolkit_slugs: List[str]) -> List[Optional[DetailedToolkitInfo]]:
+        return await self._gather_bounded(self.get_detailed_toolkit_info, toolkit_slugs)
+
     async def get_toolkit_tools(self, toolkit_slug: str, limit: int = 50, cursor: Optional[str] = None) -> ToolsListResponse:
         try:
-            logger.info(f"Fetching tools for toolkit: {toolkit_slug}")
+            logger.debug("Fetching tools for toolkit: %s", toolkit_slug)
             
             params = {
                 "limit": limit,
@@ -428,22 +534,13 @@ class ToolkitService:
                 params["cursor"] = cursor
             
             tools_response = self.client.tools.list(**params)
-            
-            if hasattr(tools_response, '__dict__'):
-                response_data = tools_response.__dict__
-            else:
-                response_data = tools_response
+            response_data = _to_dict(tools_response)
             
             items = response_data.get('items', [])
             
             tools = []
             for item in items:
-                if hasattr(item, '__dict__'):
-                    tool_data = item.__dict__
-                elif hasattr(item, '_asdict'):
-                    tool_data = item._asdict()
-                else:
-                    tool_data = item
+                tool_data = _to_dict(item)
                 
                 input_params_raw = tool_data.get("input_parameters", {})
                 output_params_raw = tool_data.get("output_parameters", {})
@@ -479,7 +576,7 @@ class ToolkitService:
                 next_cursor=response_data.get("next_cursor")
             )
             
-            logger.info(f"Successfully fetched {len(tools)} tools for toolkit {toolkit_slug}")
+            logger.debug("Successfully fetched %d tools for toolkit %s", len(tools), toolkit_slug)
             return result
             
         except Exception as e:
@@ -35,11 +35,7 @@ export interface AuthConfigField {
 export interface AuthConfigDetails {
   name: string;
   mode: string;
-  fields: {
-    [fieldType: string]: {
-      [requirementLevel: string]: AuthConfigField[];
-    };
-  };
+  fields: [fieldType: string, requirementLevel: string, field: AuthConfigField][];
 }
 
 export interface DetailedComposioToolkit {